@@ -1,143 +1,362 @@
+import atexit
 import datetime
-from flask import Flask, request, Response, render_template_string
+import gzip
+import hashlib
+from flask import Flask, request, Response, abort
+from flask_compress import Compress
+from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 import requests
-import json
+import logging
+import logging.handlers
+import queue
+import orjson
 import os
+import re
+import time
 import urllib3
 import concurrent.futures
-from functools import lru_cache
+from threading import Lock, RLock
+from cachetools import TTLCache
+from requests.adapters import HTTPAdapter
+from werkzeug.middleware.proxy_fix import ProxyFix
+from urllib3.util.retry import Retry
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:
+    rcssmin = rjsmin = None
+
+try:
+    import redis
+except ImportError:
+    redis = None
 
 # ❌ SSL Warning বন্ধ করা
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
-app = Flask(__name__)
+# ✅ Logging: records are queued and written by a background thread
+log = logging.getLogger("checkban")
+log.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+_LOG_QUEUE = queue.SimpleQueue()
+log.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+log.propagate = False
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _log_stream)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+
+# Built-in static route is replaced by the fingerprinted asset route below
+app = Flask(__name__, static_folder=None)
+
+# ✅ Transparent br/gzip for JSON and the HTML page
+app.config["COMPRESS_MIMETYPES"] = ["application/json", "text/html", "text/css", "text/javascript"]
+app.config["COMPRESS_LEVEL"] = 5
+app.config["COMPRESS_MIN_SIZE"] = 512
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_REGISTER"] = False
+compress = Compress(app)
+
+@app.after_request
+def compress_response(response):
+    # index() serves its own pre-compressed variants and honours q=0 itself
+    if request.endpoint == "index":
+        return response
+    return compress.after_request(response)
+
+# ✅ Per-client rate limit so one caller can't flood the upstream APIs
+# X-Forwarded-For is only trusted for the proxies we actually sit behind
+# (Vercel's edge is one hop); ProxyFix takes the client from the right-most
+# untrusted entry, so a spoofed left-most hop can't dodge the limit
+PROXY_HOPS = int(os.environ.get("PROXY_HOPS", 1 if os.environ.get("VERCEL") else 0))
+if PROXY_HOPS:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=PROXY_HOPS)
+
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    default_limits=["60/minute"],
+    storage_uri=os.environ.get("REDIS_URL", "memory://")
+)
+
+# ✅ Shared worker pool size for the upstream fan-out
+# Bounds how many Garena calls a process keeps in flight at once
+UPSTREAM_WORKERS = int(os.environ.get("UPSTREAM_WORKERS", 32))
+
+# Per-host keep-alive pool: info API calls run on request threads, Garena calls
+# on the worker pool, so each host needs room for the larger of the two or the
+# extra connections get opened and thrown away instead of reused
+_POOL_MAXSIZE = max(50, UPSTREAM_WORKERS, int(os.environ.get("THREADS", 32)))
+
+# ✅ Shared HTTP session (keep-alive connections reused across requests)
+# Retries cover dead connections and 5xx brownouts, never a slow read
+def new_session():
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=2,
+            connect=2,
+            read=0,
+            backoff_factor=0.1,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"],
+            # Hand the last 5xx back to the caller instead of raising RetryError
+            raise_on_status=False
+        )
+    ))
+    session.verify = False
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        "Accept": "application/json"
+    })
+    return session
+
+# ✅ Shared worker pool for the upstream fan-out (no per-request thread spawn)
+def new_executor():
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=UPSTREAM_WORKERS, thread_name_prefix="ffcheck"
+    )
+
+SESSION = new_session()
+EXECUTOR = new_executor()
+
+# (connect, read) timeouts: fail fast on unreachable hosts, tolerate slow replies
+UPSTREAM_TIMEOUT = (1.0, 4.0)
+
+def init_worker():
+    """Rebuild per-process resources after a fork (gunicorn preload_app)"""
+    global SESSION, EXECUTOR, _LOG_LISTENER
+    SESSION = new_session()
+    EXECUTOR = new_executor()
+    # Threads don't survive fork, so the log queue needs a new listener
+    _LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _log_stream)
+    _LOG_LISTENER.start()
+    atexit.register(_LOG_LISTENER.stop)
+
+# Static error bodies, serialized once
+_ERR_MISSING_UID = orjson.dumps({
+    "⚠️ error": "Player ID (uid) is required!",
+    "status_code": 400
+})
+_ERR_BAD_UID = orjson.dumps({
+    "⚠️ error": "Invalid UID format. Must be numeric!",
+    "status_code": 400
+})
+_ERR_500 = orjson.dumps({
+    "💥 exception": "Internal server error",
+    "status_code": 500
+})
+
+_ERR_429 = orjson.dumps({
+    "⚠️ error": "Too many requests, slow down!",
+    "status_code": 429
+})
+
+# ASCII digits only, same 16-digit ceiling the UI enforces
+_UID_RE = re.compile(r"\A[0-9]{1,16}\Z")
+
+# Extra headers required by the Garena ban check endpoint
+GARENA_HEADERS = {
+    "Referer": "https://ff.garena.com/en/support/",
+    "X-Requested-With": "B6FksShzIgjfrYImLpTsadjS86sddhFH"
+}
 
 # ✅ Cache for player info (reduces API calls)
-@lru_cache(maxsize=100)
+# Good results live for 5 min, failures only 30 s so upstream isn't hammered
+_CACHE = TTLCache(maxsize=1000, ttl=300)
+_NEG_CACHE = TTLCache(maxsize=1000, ttl=30)
+_LOCK = RLock()
+_INFLIGHT = {}
+
+# ✅ Serialized /check responses, so a re-check within a minute skips all work
+_RESPONSE_CACHE = TTLCache(maxsize=10_000, ttl=60)
+_RESPONSE_LOCK = Lock()
+
+# ✅ Optional shared L2 cache (Redis) so all workers reuse the same lookups
+REDIS_URL = os.environ.get("REDIS_URL")
+redis_client = (
+    redis.Redis.from_url(REDIS_URL, socket_timeout=0.5)
+    if redis is not None and REDIS_URL else None
+)
+
 def get_player_info_cached(player_id, server="BD"):
     """Cached version of player info fetching"""
-    return get_player_info(player_id, server)
+    key = (player_id, server)
+    with _LOCK:
+        cached = _CACHE.get(key) or _NEG_CACHE.get(key)
+        if cached is not None:
+            return cached
+        # Single-flight: concurrent misses for the same UID share one fetch
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = concurrent.futures.Future()
+            _INFLIGHT[key] = future
+    if not owner:
+        return future.result()
+
+    try:
+        if redis_client is not None:
+            result = get_player_info_shared(player_id, server)
+        else:
+            result = get_player_info(player_id, server)
+        with _LOCK:
+            if result["nickname"].startswith("❌"):
+                _NEG_CACHE[key] = result
+            else:
+                _CACHE[key] = result
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _LOCK:
+            _INFLIGHT.pop(key, None)
+
+def get_player_info_shared(player_id, server="BD"):
+    """Redis-backed lookup, only one worker fetches a missing UID at a time"""
+    key = f"pi:{server}:{player_id}"
+    lock_key = key + ":lock"
+    locked = False
+    try:
+        raw = redis_client.get(key)
+        if raw is None:
+            locked = bool(redis_client.set(lock_key, "1", nx=True, px=3000))
+            if not locked:
+                # Another worker is already fetching this UID, give it a moment
+                time.sleep(0.2)
+                raw = redis_client.get(key)
+    except redis.RedisError as e:
+        log.warning("redis_error uid=%s error=%.100s", player_id, e)
+        return get_player_info(player_id, server)
+
+    if raw is not None:
+        return orjson.loads(raw)
+
+    result = get_player_info(player_id, server)
+    try:
+        if not result["nickname"].startswith("❌"):
+            redis_client.setex(key, 300, orjson.dumps(result))
+        if locked:
+            redis_client.delete(lock_key)
+    except redis.RedisError as e:
+        log.warning("redis_error uid=%s error=%.100s", player_id, e)
+    return result
+
+# Shape returned when player info can't be fetched
+_DEFAULT_INFO = {
+    "nickname": "❌ Error",
+    "region": "BD",
+    "lastLoginAt": "0",
+    "lastLoginReadable": "❌ Unknown",
+    "createAt": "0",
+    "createAtReadable": "❌ Unknown",
+    "level": "0",
+    "experience": "0",
+    "rank": "Unknown",
+    "guild": "None"
+}
+
+def _default_info(server, nickname):
+    info = dict(_DEFAULT_INFO)
+    info["nickname"] = nickname
+    info["region"] = server
+    return info
+
+def _strip_tz(date_str: str) -> str:
+    """Strip the timezone from upstream dates like 2025-02-10 20:27:51 BDT"""
+    if not date_str:
+        return "❌ Unknown"
+    i = date_str.rfind(" ")
+    # Only a space after the date+time part is a timezone separator
+    return date_str[:i] if i > 10 else date_str
+
+# Shared default for missing sections of the upstream payload (never mutated)
+_EMPTY = {}
+_ELLIPSIS = "..."
+
+# Pure dict shaping, kept free of I/O and typed so it can be compiled (mypyc)
+def shape_player_info(data: dict, server: str) -> dict:
+    """Map the upstream info API payload onto our player info fields"""
+    # Parse AccountInfo section
+    account_info = data.get("AccountInfo") or _EMPTY
+    nickname = account_info.get("AccountName") or "❌ Not available"
+    region = account_info.get("AccountRegion") or server
+    level = str(account_info.get("AccountLevel") or "0")
+    experience = str(account_info.get("AccountEXP") or "0")
+    
+    # Parse dates from string format "2025-02-10 20:27:51 BDT"
+    last_login_str = account_info.get("AccountLastLogin") or ""
+    create_time_str = account_info.get("AccountCreateTime") or ""
+    
+    # Parse AccountProfileInfo for rank
+    account_profile = data.get("AccountProfileInfo") or _EMPTY
+    rank_point = account_profile.get("BrRankPoint") or "0"
+    
+    # Parse GuildInfo
+    guild_info = data.get("GuildInfo") or _EMPTY
+    guild_name = guild_info.get("GuildName") or "No Guild"
+    
+    # Parse SocialInfo for signature
+    social_info = data.get("SocialInfo") or _EMPTY
+    signature = social_info.get("signature") or ""
+    
+    last_login_readable = _strip_tz(last_login_str)
+    create_time_readable = _strip_tz(create_time_str)
+
+    return {
+        "nickname": nickname,
+        "region": region,
+        "lastLoginAt": "0",  # Keep as 0 since we don't have timestamp
+        "lastLoginReadable": last_login_readable,
+        "createAt": "0",  # Keep as 0 since we don't have timestamp
+        "createAtReadable": create_time_readable,
+        "level": level,
+        "experience": experience,
+        "rank": f"BR: {rank_point}",
+        "guild": guild_name,
+        # A non-empty 51st character means the BIO needs truncating
+        "signature": (signature[:50] + _ELLIPSIS) if signature[50:51] else signature
+    }
 
 # ✅ Updated function to parse the new API response structure
 def get_player_info(player_id, server="BD"):
     url = f"https://info-api-ecru-ten.vercel.app/get?uid={player_id}"
     
     try:
-        res = requests.get(url, timeout=5, verify=False)
+        res = SESSION.get(url, timeout=UPSTREAM_TIMEOUT)
         if res.status_code != 200:
-            print(f"[INFO ERROR] UID={player_id} | STATUS={res.status_code}")
-            return {
-                "nickname": "❌ Fetch failed",
-                "region": server,
-                "lastLoginAt": "0",
-                "lastLoginReadable": "❌ Unknown",
-                "createAt": "0",
-                "createAtReadable": "❌ Unknown",
-                "level": "0",
-                "experience": "0",
-                "rank": "Unknown",
-                "guild": "None"
-            }
+            log.warning("info_error uid=%s status=%s", player_id, res.status_code)
+            return _default_info(server, "❌ Fetch failed")
 
-        data = res.json()
-        
-        # Parse AccountInfo section
-        account_info = data.get("AccountInfo", {})
-        nickname = account_info.get("AccountName", "❌ Not available")
-        region = account_info.get("AccountRegion", server)
-        level = str(account_info.get("AccountLevel", "0"))
-        experience = str(account_info.get("AccountEXP", "0"))
-        
-        # Parse dates from string format "2025-02-10 20:27:51 BDT"
-        last_login_str = account_info.get("AccountLastLogin", "")
-        create_time_str = account_info.get("AccountCreateTime", "")
-        
-        # Parse AccountProfileInfo for rank
-        account_profile = data.get("AccountProfileInfo", {})
-        rank_point = account_profile.get("BrRankPoint", "0")
-        
-        # Parse GuildInfo
-        guild_info = data.get("GuildInfo", {})
-        guild_name = guild_info.get("GuildName", "No Guild")
-        
-        # Parse SocialInfo for signature
-        social_info = data.get("SocialInfo", {})
-        signature = social_info.get("signature", "")
-        
-        # Function to parse date string with timezone
-        def parse_date_string(date_str):
-            if not date_str:
-                return "❌ Unknown"
-            try:
-                # Remove timezone part (BDT, IST, etc.)
-                date_part = date_str.split(" ")[:2]
-                if len(date_part) >= 2:
-                    return " ".join(date_part)
-                return date_str
-            except:
-                return date_str
-
-        last_login_readable = parse_date_string(last_login_str)
-        create_time_readable = parse_date_string(create_time_str)
-
-        return {
-            "nickname": nickname,
-            "region": region,
-            "lastLoginAt": "0",  # Keep as 0 since we don't have timestamp
-            "lastLoginReadable": last_login_readable,
-            "createAt": "0",  # Keep as 0 since we don't have timestamp
-            "createAtReadable": create_time_readable,
-            "level": level,
-            "experience": experience,
-            "rank": f"BR: {rank_point}",
-            "guild": guild_name,
-            "signature": signature[:50] + "..." if len(signature) > 50 else signature
-        }
+        return shape_player_info(orjson.loads(res.content), server)
 
     except requests.Timeout:
-        print(f"[TIMEOUT ERROR] UID={player_id}")
-        return {
-            "nickname": "❌ Timeout",
-            "region": server,
-            "lastLoginAt": "0",
-            "lastLoginReadable": "❌ Unknown",
-            "createAt": "0",
-            "createAtReadable": "❌ Unknown",
-            "level": "0",
-            "experience": "0",
-            "rank": "Unknown",
-            "guild": "None"
-        }
+        log.warning("timeout_error uid=%s", player_id)
+        return _default_info(server, "❌ Timeout")
     except Exception as e:
-        print(f"[PLAYER INFO ERROR] UID={player_id} | ERROR={str(e)[:100]}")
-        return {
-            "nickname": "❌ Error",
-            "region": server,
-            "lastLoginAt": "0",
-            "lastLoginReadable": "❌ Unknown",
-            "createAt": "0",
-            "createAtReadable": "❌ Unknown",
-            "level": "0",
-            "experience": "0",
-            "rank": "Unknown",
-            "guild": "None"
-        }
+        log.warning("player_info_error uid=%s error=%.100s", player_id, e)
+        return _default_info(server, "❌ Error")
 
 # ✅ Fast ban checking function
 def check_ban_status(player_id):
     """Check ban status from Garena API"""
     url = f"https://ff.garena.com/api/antihack/check_banned?lang=en&uid={player_id}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Accept": "application/json",
-        "Referer": "https://ff.garena.com/en/support/",
-        "X-Requested-With": "B6FksShzIgjfrYImLpTsadjS86sddhFH"
-    }
     
     try:
-        response = requests.get(url, headers=headers, verify=False, timeout=3)
+        response = SESSION.get(url, headers=GARENA_HEADERS, timeout=UPSTREAM_TIMEOUT)
         if response.status_code == 200:
-            data = response.json().get("data", {})
+            data = orjson.loads(response.content).get("data", {})
             return {
                 "is_banned": data.get("is_banned", 0),
                 "period": data.get("period", 0),
@@ -147,23 +366,36 @@ def check_ban_status(player_id):
     except:
         return {"is_banned": 0, "period": 0, "success": False}
 
+# Static values of the /check response
+STATUS_OK = "Account checked successfully"
+STATUS_PARTIAL = "Partial data fetched"
+BANNED = "🚫 BANNED"
+NOT_BANNED = "✅ NOT BANNED"
+NO_BAN = "No ban"
+POWERED_BY = "@dev_eco"
+CHANNEL = "https://discord.gg/Mba5bNbdCP"
+
 # ✅ Enhanced parallel processing with more info
 def check_banned_fast(player_id, server="BD"):
     """Parallel execution for faster response with enhanced info"""
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit both tasks in parallel
-        player_info_future = executor.submit(get_player_info_cached, player_id, server)
-        ban_info_future = executor.submit(check_ban_status, player_id)
-        
-        # Get results
-        player_info = player_info_future.result()
-        ban_info = ban_info_future.result()
-    
+    # Ban check runs in the pool while player info is fetched on this thread
+    ban_info_future = EXECUTOR.submit(check_ban_status, player_id)
+    player_info = get_player_info_cached(player_id, server)
+    ban_info = ban_info_future.result()
+    return build_result(player_id, player_info, ban_info)
+
+def build_result(player_id: str, player_info: dict, ban_info: dict) -> dict:
+    """Assemble the /check response from player info and ban status"""
     # Prepare enhanced response
     is_banned = ban_info["is_banned"]
+    if is_banned:
+        account, duration = BANNED, f"{ban_info['period']} month(s)"
+    else:
+        account, duration = NOT_BANNED, NO_BAN
     
+    # A dict literal beats dict(zip(keys, values)): keys are already code constants
     result = {
-        "✅ Status": "Account checked successfully" if ban_info["success"] else "Partial data fetched",
+        "✅ Status": STATUS_OK if ban_info["success"] else STATUS_PARTIAL,
         "🆔 UID": player_id,
         "🏷️ Nickname": player_info["nickname"],
         "🌍 Region": player_info["region"],
@@ -173,11 +405,11 @@ def check_banned_fast(player_id, server="BD"):
         "👥 Guild": player_info["guild"],
         "🕒 Last Login": player_info["lastLoginReadable"],
         "🆕 Created At": player_info["createAtReadable"],
-        "🔒 Account": "🚫 BANNED" if is_banned else "✅ NOT BANNED",
-        "⏳ Duration": f"{ban_info['period']} month(s)" if is_banned else "No ban",
+        "🔒 Account": account,
+        "⏳ Duration": duration,
         "📊 Banned?": bool(is_banned),
-        "💎 Powered by": "@dev_eco",
-        "📡 Channel": "https://discord.gg/Mba5bNbdCP"
+        "💎 Powered by": POWERED_BY,
+        "📡 Channel": CHANNEL
     }
     
     # Add signature if available
@@ -186,99 +418,141 @@ def check_banned_fast(player_id, server="BD"):
     
     return result
 
+def _jsonify(obj, status=200, pretty=False):
+    """Serialize with orjson, indented only when explicitly asked for"""
+    opts = orjson.OPT_INDENT_2 if pretty else 0
+    return Response(orjson.dumps(obj, option=opts), mimetype="application/json", status=status)
+
+@app.errorhandler(429)
+def rate_limited(e):
+    return Response(_ERR_429, mimetype="application/json", status=429)
+
 @app.route("/check", methods=["GET"])
+@limiter.limit("10/second")
 def check():
     player_id = request.args.get("uid", "")
     server = request.args.get("server", "BD")
+    pretty = request.args.get("pretty") == "1"
     
     if not player_id:
-        return Response(
-            json.dumps({
-                "⚠️ error": "Player ID (uid) is required!",
-                "status_code": 400
-            }, indent=2),
-            mimetype="application/json",
-            status=400
-        )
+        return Response(_ERR_MISSING_UID, mimetype="application/json", status=400)
     
     # Validate UID format
-    if not player_id.isdigit():
-        return Response(
-            json.dumps({
-                "⚠️ error": "Invalid UID format. Must be numeric!",
-                "status_code": 400
-            }, indent=2),
-            mimetype="application/json",
-            status=400
-        )
+    if not _UID_RE.match(player_id):
+        return Response(_ERR_BAD_UID, mimetype="application/json", status=400)
     
+    key = (player_id, server, pretty)
+    with _RESPONSE_LOCK:
+        body = _RESPONSE_CACHE.get(key)
+    if body is not None:
+        response = Response(body, mimetype="application/json")
+        response.headers["X-Cache"] = "HIT"
+        response.headers["Cache-Control"] = "public, max-age=60"
+        return response
+
     try:
         result = check_banned_fast(player_id, server)
-        return Response(
-            json.dumps(result, indent=2, ensure_ascii=False),
-            mimetype="application/json",
-            status=200
-        )
+        response = _jsonify(result, pretty=pretty)
+        response.headers["X-Cache"] = "MISS"
+        # Only complete answers are worth repeating; partial ones should retry upstream
+        if result["✅ Status"] == STATUS_OK and not result["🏷️ Nickname"].startswith("❌"):
+            with _RESPONSE_LOCK:
+                _RESPONSE_CACHE[key] = response.get_data()
+            response.headers["Cache-Control"] = "public, max-age=60"
+        return response
     except Exception as e:
-        print(f"[ROUTE ERROR] UID={player_id} | ERROR={e}")
-        return Response(
-            json.dumps({
-                "💥 exception": "Internal server error",
-                "status_code": 500
-            }, indent=2),
-            mimetype="application/json",
-            status=500
-        )
+        log.error("route_error uid=%s error=%s", player_id, e)
+        return Response(_ERR_500, mimetype="application/json", status=500)
 
 @app.route("/health", methods=["GET"])
 def health_check():
     """Health check endpoint"""
-    return Response(
-        json.dumps({
-            "status": "✅ OK",
-            "service": "Free Fire Ban Check API",
-            "version": "2.0",
-            "uptime": datetime.datetime.now().isoformat(),
-            "features": ["Ban Check", "Account Info", "Guild Info", "Rank Info"]
-        }, indent=2),
-        mimetype="application/json"
-    )
+    return _jsonify({
+        "status": "✅ OK",
+        "service": "Free Fire Ban Check API",
+        "version": "2.0",
+        "uptime": datetime.datetime.now().isoformat(),
+        "features": ["Ban Check", "Account Info", "Guild Info", "Rank Info"]
+    }, pretty=request.args.get("pretty") == "1")
 
 @app.route("/info/<uid>", methods=["GET"])
+@limiter.limit("10/second")
 def get_full_info(uid):
     """Get full account information from the API"""
+    pretty = request.args.get("pretty") == "1"
+    if not _UID_RE.match(uid):
+        return Response(_ERR_BAD_UID, mimetype="application/json", status=400)
+
     try:
         url = f"https://info-api-ecru-ten.vercel.app/get?uid={uid}"
-        response = requests.get(url, timeout=5, verify=False)
+        response = SESSION.get(url, timeout=UPSTREAM_TIMEOUT)
         
         if response.status_code == 200:
-            data = response.json()
+            if pretty:
+                return _jsonify(orjson.loads(response.content), pretty=True)
+            # Pass the upstream body through untouched, no parse/re-serialize
             return Response(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                mimetype="application/json",
+                response.content,
+                content_type=response.headers.get("Content-Type", "application/json"),
                 status=200
             )
         else:
-            return Response(
-                json.dumps({
-                    "⚠️ error": "Failed to fetch account info",
-                    "status_code": response.status_code
-                }, indent=2),
-                mimetype="application/json",
-                status=response.status_code
-            )
+            return _jsonify({
+                "⚠️ error": "Failed to fetch account info",
+                "status_code": response.status_code
+            }, status=response.status_code, pretty=pretty)
     except Exception as e:
-        print(f"[FULL INFO ERROR] UID={uid} | ERROR={e}")
-        return Response(
-            json.dumps({
-                "💥 exception": "Internal server error",
-                "status_code": 500
-            }, indent=2),
-            mimetype="application/json",
-            status=500
-        )
-
-# Premium HTML Template with CSS - UPDATED for new fields
+        log.error("full_info_error uid=%s error=%s", uid, e)
+        return Response(_ERR_500, mimetype="application/json", status=500)
+
+# ✅ Static assets: loaded once, served under a content hash so they can be cached forever
+_STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+_ASSETS = {}
+# Plain file name -> current fingerprinted name, for requests carrying another build's hash
+_CURRENT_ASSETS = {}
+
+def register_asset(filename, content_type, minify=None):
+    """Load (and optionally minify) a file from static/, return its fingerprinted URL"""
+    with open(os.path.join(_STATIC_DIR, filename), "rb") as f:
+        data = f.read()
+    if minify is not None:
+        data = minify(data.decode("utf-8")).encode("utf-8")
+    name, ext = os.path.splitext(filename)
+    hashed = f"{name}.{hashlib.blake2b(data, digest_size=6).hexdigest()}{ext}"
+    _ASSETS[hashed] = (data, content_type)
+    _CURRENT_ASSETS[filename] = hashed
+    return f"/static/{hashed}"
+
+APP_CSS_URL = register_asset(
+    "app.css", "text/css; charset=utf-8", rcssmin.cssmin if rcssmin else None
+)
+APP_JS_URL = register_asset(
+    "app.js", "text/javascript; charset=utf-8", rjsmin.jsmin if rjsmin else None
+)
+
+@app.route("/static/<name>", methods=["GET"])
+@limiter.exempt
+def static_asset(name):
+    asset = _ASSETS.get(name)
+    if asset is not None:
+        response = Response(asset[0], content_type=asset[1])
+        # The URL changes whenever the content does, so it never needs revalidating
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+    # A page from another build (before a deploy, or from an overlapping
+    # instance) asks for a hash we don't have: serve the current file rather
+    # than a 404, but don't let it be cached under that hash
+    base, _, ext = name.rpartition(".")
+    current = _CURRENT_ASSETS.get(base.rpartition(".")[0] + "." + ext)
+    if current is None:
+        abort(404)
+    data, content_type = _ASSETS[current]
+    response = Response(data, content_type=content_type)
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+# Premium HTML Template - styles and script live in static/
 PREMIUM_HTML = """
 <!DOCTYPE html>
 <html lang="en">
@@ -288,616 +562,13 @@ PREMIUM_HTML = """
     <title>🔥 Free Fire Ban Check - Premium API</title>
     <link rel="preconnect" href="https://fonts.googleapis.com">
     <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com" crossorigin>
+    <link rel="dns-prefetch" href="https://cdnjs.cloudflare.com">
+    <link rel="preload" as="style" href="__APP_CSS__">
     <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&family=Outfit:wght@400;500;600;700&family=JetBrains+Mono:wght@300;400&display=swap" rel="stylesheet">
     <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <style>
-        :root {
-            /* Color Palette - Dark & Premium */
-            --bg-core: #050505;
-            --bg-surface: #0f0f0f;
-            --bg-surface-hover: #1a1a1a;
-            --bg-glass: rgba(20, 20, 20, 0.7);
-            --bg-gradient: linear-gradient(135deg, #0f0f0f 0%, #1a1a1a 100%);
-
-            --primary-hue: 16;
-            --primary: hsl(var(--primary-hue), 100%, 50%);
-            --primary-dim: hsl(var(--primary-hue), 100%, 30%);
-            --primary-glow: hsla(var(--primary-hue), 100%, 50%, 0.3);
-
-            --accent-cyan: #00f2ff;
-            --accent-purple: #bd00ff;
-            --accent-gradient: linear-gradient(90deg, var(--accent-cyan), var(--accent-purple));
-
-            --text-main: #ffffff;
-            --text-muted: #a0a0a0;
-            --text-dim: #505050;
-
-            --border-light: rgba(255, 255, 255, 0.1);
-            --border-active: rgba(255, 69, 0, 0.5);
-
-            --success: #00ff9d;
-            --error: #ff2a6d;
-            --warning: #ffb300;
-
-            /* Spacing & Layout */
-            --radius-sm: 4px;
-            --radius-md: 8px;
-            --radius-lg: 16px;
-            --radius-xl: 24px;
-            --radius-full: 9999px;
-
-            --space-xs: 0.5rem;
-            --space-sm: 1rem;
-            --space-md: 2rem;
-            --space-lg: 4rem;
-            --space-xl: 6rem;
-
-            /* Typography */
-            --font-ui: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            --font-display: 'Outfit', sans-serif;
-            --font-mono: 'JetBrains Mono', monospace;
-
-            /* Shadows & Effects */
-            --shadow-sm: 0 4px 6px rgba(0, 0, 0, 0.1);
-            --shadow-md: 0 10px 20px rgba(0, 0, 0, 0.25);
-            --shadow-lg: 0 20px 40px rgba(0, 0, 0, 0.3);
-            --shadow-glow: 0 0 30px var(--primary-glow);
-
-            /* Animation */
-            --ease-out: cubic-bezier(0.215, 0.61, 0.355, 1);
-            --ease-in-out: cubic-bezier(0.645, 0.045, 0.355, 1);
-            --transition-fast: 0.2s var(--ease-out);
-            --transition-normal: 0.3s var(--ease-in-out);
-        }
-
-        /* Reset & Base */
-        *,
-        *::before,
-        *::after {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-
-        body {
-            background-color: var(--bg-core);
-            color: var(--text-main);
-            font-family: var(--font-ui);
-            line-height: 1.6;
-            overflow-x: hidden;
-            min-height: 100vh;
-            background-image: 
-                radial-gradient(circle at 20% 30%, rgba(255, 69, 0, 0.05) 0%, transparent 20%),
-                radial-gradient(circle at 80% 70%, rgba(0, 242, 255, 0.05) 0%, transparent 20%);
-        }
-
-        /* Glass Effect */
-        .glass {
-            background: var(--bg-glass);
-            backdrop-filter: blur(20px);
-            -webkit-backdrop-filter: blur(20px);
-            border: 1px solid var(--border-light);
-        }
-
-        /* Container */
-        .container {
-            width: 100%;
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 0 var(--space-md);
-        }
-
-        /* Header */
-        .header {
-            padding: var(--space-md) 0;
-            position: relative;
-            overflow: hidden;
-        }
-
-        .header::before {
-            content: '';
-            position: absolute;
-            top: -50%;
-            left: -50%;
-            width: 200%;
-            height: 200%;
-            background: radial-gradient(circle at center, var(--primary-glow) 0%, transparent 70%);
-            opacity: 0.1;
-            z-index: -1;
-        }
-
-        .logo {
-            display: flex;
-            align-items: center;
-            gap: var(--space-sm);
-            margin-bottom: var(--space-sm);
-        }
-
-        .logo-icon {
-            width: 48px;
-            height: 48px;
-            background: var(--accent-gradient);
-            border-radius: var(--radius-md);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.5rem;
-            color: white;
-        }
-
-        .logo-text {
-            font-family: var(--font-display);
-            font-size: 2rem;
-            font-weight: 700;
-            background: var(--accent-gradient);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-
-        .tagline {
-            font-size: 1.1rem;
-            color: var(--text-muted);
-            margin-bottom: var(--space-md);
-            max-width: 600px;
-        }
-
-        /* Stats Grid */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: var(--space-sm);
-            margin-bottom: var(--space-xl);
-        }
-
-        .stat-card {
-            padding: var(--space-md);
-            border-radius: var(--radius-lg);
-            background: var(--bg-surface);
-            border: 1px solid var(--border-light);
-            transition: var(--transition-normal);
-        }
-
-        .stat-card:hover {
-            transform: translateY(-4px);
-            border-color: var(--primary);
-            box-shadow: var(--shadow-glow);
-        }
-
-        .stat-icon {
-            width: 48px;
-            height: 48px;
-            border-radius: var(--radius-md);
-            background: var(--bg-surface-hover);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            margin-bottom: var(--space-sm);
-            font-size: 1.5rem;
-            color: var(--primary);
-        }
-
-        .stat-value {
-            font-family: var(--font-display);
-            font-size: 2rem;
-            font-weight: 700;
-            margin-bottom: var(--space-xs);
-            background: var(--accent-gradient);
-            -webkit-background-clip: text;
-            background-clip: text;
-            color: transparent;
-        }
-
-        .stat-label {
-            color: var(--text-muted);
-            font-size: 0.9rem;
-        }
-
-        /* Main Content */
-        .main-content {
-            display: grid;
-            grid-template-columns: 1fr 1.2fr;
-            gap: var(--space-lg);
-            margin-bottom: var(--space-xl);
-        }
-
-        @media (max-width: 1024px) {
-            .main-content {
-                grid-template-columns: 1fr;
-            }
-        }
-
-        /* Check Panel */
-        .check-panel {
-            padding: var(--space-lg);
-            border-radius: var(--radius-xl);
-            background: var(--bg-gradient);
-            border: 1px solid var(--border-light);
-        }
-
-        .panel-header {
-            margin-bottom: var(--space-md);
-        }
-
-        .panel-title {
-            font-family: var(--font-display);
-            font-size: 1.8rem;
-            font-weight: 600;
-            margin-bottom: var(--space-xs);
-            display: flex;
-            align-items: center;
-            gap: var(--space-sm);
-        }
-
-        .panel-title i {
-            color: var(--primary);
-        }
-
-        .panel-subtitle {
-            color: var(--text-muted);
-            font-size: 1rem;
-        }
-
-        /* Form */
-        .form-group {
-            margin-bottom: var(--space-md);
-        }
-
-        .form-label {
-            display: block;
-            margin-bottom: var(--space-xs);
-            color: var(--text-main);
-            font-weight: 500;
-        }
-
-        .form-input {
-            width: 100%;
-            padding: var(--space-sm) var(--space-md);
-            background: var(--bg-surface);
-            border: 1px solid var(--border-light);
-            border-radius: var(--radius-md);
-            color: var(--text-main);
-            font-family: var(--font-ui);
-            font-size: 1rem;
-            transition: var(--transition-fast);
-        }
-
-        .form-input:focus {
-            outline: none;
-            border-color: var(--primary);
-            box-shadow: 0 0 0 3px var(--primary-glow);
-        }
-
-        .form-input::placeholder {
-            color: var(--text-dim);
-        }
-
-        .server-select {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(80px, 1fr));
-            gap: var(--space-sm);
-            margin-top: var(--space-xs);
-        }
-
-        .server-option {
-            padding: var(--space-sm);
-            background: var(--bg-surface);
-            border: 1px solid var(--border-light);
-            border-radius: var(--radius-md);
-            text-align: center;
-            cursor: pointer;
-            transition: var(--transition-fast);
-        }
-
-        .server-option:hover {
-            background: var(--bg-surface-hover);
-        }
-
-        .server-option.active {
-            background: var(--primary);
-            border-color: var(--primary);
-            color: white;
-        }
-
-        .submit-btn {
-            width: 100%;
-            padding: var(--space-sm) var(--space-md);
-            background: var(--accent-gradient);
-            border: none;
-            border-radius: var(--radius-md);
-            color: white;
-            font-family: var(--font-display);
-            font-size: 1.1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: var(--transition-normal);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: var(--space-sm);
-        }
-
-        .submit-btn:hover {
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-glow);
-        }
-
-        .submit-btn:active {
-            transform: translateY(0);
-        }
-
-        /* Result Panel */
-        .result-panel {
-            padding: var(--space-lg);
-            border-radius: var(--radius-xl);
-            background: var(--bg-gradient);
-            border: 1px solid var(--border-light);
-            opacity: 0;
-            transform: translateY(20px);
-            transition: var(--transition-normal);
-        }
-
-        .result-panel.show {
-            opacity: 1;
-            transform: translateY(0);
-        }
-
-        .result-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: var(--space-md);
-            padding-bottom: var(--space-sm);
-            border-bottom: 1px solid var(--border-light);
-        }
-
-        .result-title {
-            font-family: var(--font-display);
-            font-size: 1.5rem;
-            font-weight: 600;
-        }
-
-        .result-status {
-            padding: var(--space-xs) var(--space-sm);
-            border-radius: var(--radius-full);
-            font-size: 0.9rem;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-
-        .result-status.banned {
-            background: rgba(255, 42, 109, 0.2);
-            color: var(--error);
-            border: 1px solid var(--error);
-        }
-
-        .result-status.clean {
-            background: rgba(0, 255, 157, 0.2);
-            color: var(--success);
-            border: 1px solid var(--success);
-        }
-
-        .result-grid {
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(250px, 1fr));
-            gap: var(--space-sm);
-        }
-
-        .result-card {
-            padding: var(--space-sm);
-            background: var(--bg-surface);
-            border-radius: var(--radius-md);
-            border: 1px solid var(--border-light);
-        }
-
-        .result-card-header {
-            display: flex;
-            align-items: center;
-            gap: var(--space-xs);
-            margin-bottom: var(--space-xs);
-        }
-
-        .result-card-icon {
-            color: var(--primary);
-            font-size: 0.9rem;
-        }
-
-        .result-card-label {
-            color: var(--text-muted);
-            font-size: 0.9rem;
-            font-weight: 500;
-        }
-
-        .result-card-value {
-            font-family: var(--font-mono);
-            font-weight: 500;
-            word-break: break-word;
-        }
-
-        .result-card-value.banned {
-            color: var(--error);
-            font-weight: 600;
-        }
-
-        .result-card-value.clean {
-            color: var(--success);
-            font-weight: 600;
-        }
-
-        /* API Docs */
-        .docs-panel {
-            margin-top: var(--space-xl);
-            padding: var(--space-lg);
-            border-radius: var(--radius-xl);
-            background: var(--bg-gradient);
-            border: 1px solid var(--border-light);
-        }
-
-        .docs-header {
-            margin-bottom: var(--space-md);
-        }
-
-        .docs-title {
-            font-family: var(--font-display);
-            font-size: 1.8rem;
-            font-weight: 600;
-            margin-bottom: var(--space-xs);
-            display: flex;
-            align-items: center;
-            gap: var(--space-sm);
-        }
-
-        .docs-title i {
-            color: var(--accent-cyan);
-        }
-
-        .endpoint-list {
-            display: flex;
-            flex-direction: column;
-            gap: var(--space-md);
-        }
-
-        .endpoint-item {
-            padding: var(--space-md);
-            background: var(--bg-surface);
-            border-radius: var(--radius-lg);
-            border: 1px solid var(--border-light);
-        }
-
-        .endpoint-method {
-            display: inline-block;
-            padding: var(--space-xs) var(--space-sm);
-            background: var(--primary);
-            color: white;
-            border-radius: var(--radius-sm);
-            font-family: var(--font-mono);
-            font-size: 0.9rem;
-            font-weight: 600;
-            margin-right: var(--space-sm);
-        }
-
-        .endpoint-path {
-            font-family: var(--font-mono);
-            color: var(--accent-cyan);
-            font-size: 1.1rem;
-        }
-
-        .endpoint-desc {
-            color: var(--text-muted);
-            margin-top: var(--space-xs);
-            font-size: 0.95rem;
-        }
-
-        /* Footer */
-        .footer {
-            margin-top: var(--space-xl);
-            padding: var(--space-lg) 0;
-            border-top: 1px solid var(--border-light);
-            text-align: center;
-        }
-
-        .footer-content {
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            gap: var(--space-md);
-        }
-
-        .social-links {
-            display: flex;
-            gap: var(--space-md);
-        }
-
-        .social-link {
-            width: 40px;
-            height: 40px;
-            border-radius: var(--radius-full);
-            background: var(--bg-surface);
-            border: 1px solid var(--border-light);
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            color: var(--text-main);
-            text-decoration: none;
-            transition: var(--transition-fast);
-        }
-
-        .social-link:hover {
-            background: var(--primary);
-            transform: translateY(-2px);
-            border-color: var(--primary);
-        }
-
-        .copyright {
-            color: var(--text-muted);
-            font-size: 0.9rem;
-        }
-
-        .powered-by {
-            color: var(--text-dim);
-            font-size: 0.8rem;
-            margin-top: var(--space-xs);
-        }
-
-        /* Loading Animation */
-        .loading {
-            display: none;
-            text-align: center;
-            padding: var(--space-md);
-        }
-
-        .loading.show {
-            display: block;
-        }
-
-        .spinner {
-            width: 40px;
-            height: 40px;
-            border: 3px solid var(--border-light);
-            border-top-color: var(--primary);
-            border-radius: 50%;
-            margin: 0 auto var(--space-sm);
-            animation: spin 1s linear infinite;
-        }
-
-        @keyframes spin {
-            to { transform: rotate(360deg); }
-        }
-
-        /* Responsive */
-        @media (max-width: 768px) {
-            .container {
-                padding: 0 var(--space-sm);
-            }
-            
-            .header, .main-content, .docs-panel {
-                padding: var(--space-md);
-            }
-            
-            .logo-text {
-                font-size: 1.5rem;
-            }
-            
-            .panel-title {
-                font-size: 1.5rem;
-            }
-            
-            .result-grid {
-                grid-template-columns: 1fr;
-            }
-        }
-
-        /* Animations */
-        @keyframes fadeIn {
-            from { opacity: 0; transform: translateY(10px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-
-        .animate-in {
-            animation: fadeIn 0.5s var(--ease-out) forwards;
-        }
-    </style>
+    <link rel="stylesheet" href="__APP_CSS__">
+    <script defer src="__APP_JS__"></script>
 </head>
 <body>
     <div class="container">
@@ -1029,6 +700,17 @@ PREMIUM_HTML = """
                 <div class="result-grid" id="resultGrid">
                     <!-- Results will be populated here by JavaScript -->
                 </div>
+
+                <!-- Result card, cloned once per field -->
+                <template id="cardTpl">
+                    <div class="result-card">
+                        <div class="result-card-header">
+                            <i class="fas result-card-icon"></i>
+                            <span class="result-card-label"></span>
+                        </div>
+                        <div class="result-card-value"></div>
+                    </div>
+                </template>
             </section>
         </main>
 
@@ -1051,6 +733,7 @@ PREMIUM_HTML = """
                     <p class="endpoint-desc">
                         Enhanced account analysis with ban status, level, experience, rank, guild info, and more.
                         Returns detailed JSON response with comprehensive account data.
+                        Add &pretty=1 for indented output.
                     </p>
                 </div>
                 <div class="endpoint-item">
@@ -1095,167 +778,76 @@ PREMIUM_HTML = """
             </div>
         </footer>
     </div>
-
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            // Server selection
-            const serverOptions = document.querySelectorAll('.server-option');
-            let selectedServer = 'BD';
-            
-            serverOptions.forEach(option => {
-                option.addEventListener('click', function() {
-                    serverOptions.forEach(opt => opt.classList.remove('active'));
-                    this.classList.add('active');
-                    selectedServer = this.dataset.value;
-                });
-            });
-
-            // Form submission
-            const form = document.getElementById('checkForm');
-            const resultPanel = document.getElementById('resultPanel');
-            const resultGrid = document.getElementById('resultGrid');
-            const loading = document.getElementById('loading');
-            
-            // Template for result cards
-            const resultCardTemplate = (icon, label, value, className = '') => `
-                <div class="result-card">
-                    <div class="result-card-header">
-                        <i class="fas ${icon} result-card-icon"></i>
-                        <span class="result-card-label">${label}</span>
-                    </div>
-                    <div class="result-card-value ${className}">${value}</div>
-                </div>
-            `;
-            
-            form.addEventListener('submit', async function(e) {
-                e.preventDefault();
-                
-                const uidInput = document.getElementById('uid');
-                const uid = uidInput.value.trim();
-                
-                if (!uid.match(/^\d{8,16}$/)) {
-                    alert('Please enter a valid 8-16 digit UID');
-                    return;
-                }
-                
-                // Show loading
-                loading.classList.add('show');
-                resultPanel.classList.remove('show');
-                resultGrid.innerHTML = '';
-                
-                try {
-                    // Make API request
-                    const response = await fetch(`/check?uid=${uid}&server=${selectedServer}`);
-                    const data = await response.json();
-                    
-                    // Update UI with results
-                    updateResults(data);
-                    
-                    // Show results
-                    resultPanel.classList.add('show');
-                } catch (error) {
-                    console.error('Error:', error);
-                    alert('Failed to check account. Please try again.');
-                } finally {
-                    // Hide loading
-                    loading.classList.remove('show');
-                }
-            });
-
-            // Update results function
-            function updateResults(data) {
-                // Get status badge
-                const statusBadge = document.getElementById('statusBadge');
-                
-                // Clear previous results
-                resultGrid.innerHTML = '';
-                
-                // Add all data fields
-                const fields = [
-                    { key: '🆔 UID', icon: 'fa-id-badge', label: 'UID' },
-                    { key: '🏷️ Nickname', icon: 'fa-user', label: 'Nickname' },
-                    { key: '🌍 Region', icon: 'fa-globe', label: 'Region' },
-                    { key: '⭐ Level', icon: 'fa-star', label: 'Level' },
-                    { key: '⚡ Experience', icon: 'fa-bolt', label: 'Experience' },
-                    { key: '📊 Rank', icon: 'fa-chart-line', label: 'Rank Points' },
-                    { key: '👥 Guild', icon: 'fa-users', label: 'Guild' },
-                    { key: '🕒 Last Login', icon: 'fa-sign-in-alt', label: 'Last Login' },
-                    { key: '🆕 Created At', icon: 'fa-calendar-plus', label: 'Created At' },
-                    { key: '🔒 Account', icon: 'fa-shield-alt', label: 'Ban Status', className: () => data['📊 Banned?'] ? 'banned' : 'clean' },
-                    { key: '⏳ Duration', icon: 'fa-clock', label: 'Ban Duration' }
-                ];
-                
-                // Check for signature
-                if (data['✏️ BIO']) {
-                    fields.push({ key: '✏️ BIO', icon: 'fa-quote-left', label: 'BIO' });
-                }
-                
-                // Add powered by
-                fields.push({ key: '💎 Powered by', icon: 'fa-gem', label: 'Powered By' });
-                fields.push({ key: '📡 Channel', icon: 'fa-broadcast-tower', label: 'Community' });
-                
-                // Create cards for each field
-                fields.forEach(field => {
-                    if (data[field.key]) {
-                        const className = typeof field.className === 'function' ? field.className() : '';
-                        const cardHtml = resultCardTemplate(
-                            field.icon,
-                            field.label,
-                            data[field.key],
-                            className
-                        );
-                        resultGrid.innerHTML += cardHtml;
-                    }
-                });
-                
-                // Update badge
-                const isBanned = data['📊 Banned?'];
-                if (isBanned) {
-                    statusBadge.textContent = '🚫 BANNED';
-                    statusBadge.className = 'result-status banned';
-                } else {
-                    statusBadge.textContent = '✅ CLEAN';
-                    statusBadge.className = 'result-status clean';
-                }
-                
-                // Add animation
-                resultPanel.classList.remove('animate-in');
-                void resultPanel.offsetWidth; // Trigger reflow
-                resultPanel.classList.add('animate-in');
-            }
-
-            // Example UID input
-            document.getElementById('uid').addEventListener('click', function() {
-                if (this.value === '') {
-                    this.value = '1234567890';
-                    setTimeout(() => this.select(), 100);
-                }
-            });
-
-            // Animate elements on load
-            const elements = document.querySelectorAll('.stat-card, .check-panel, .docs-panel');
-            elements.forEach((el, index) => {
-                setTimeout(() => {
-                    el.classList.add('animate-in');
-                }, index * 100);
-            });
-        });
-    </script>
 </body>
 </html>
 """
 
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_HTML_SPACE_RE = re.compile(r"\s+")
+
+def minify_html(html):
+    """Drop comments and collapse whitespace runs (the page has no <pre>/<textarea>)"""
+    return _HTML_SPACE_RE.sub(" ", _HTML_COMMENT_RE.sub("", html)).strip()
+
+# The page has no template variables, so encode it once instead of running Jinja per request
+_PREMIUM_HTML_BYTES = minify_html(
+    PREMIUM_HTML
+    .replace("__APP_CSS__", APP_CSS_URL)
+    .replace("__APP_JS__", APP_JS_URL)
+).encode("utf-8")
+_PREMIUM_HTML_ETAG = hashlib.blake2b(_PREMIUM_HTML_BYTES, digest_size=12).hexdigest()
+# Only the encoded bytes are served; don't keep the (UCS-4, emoji) str around too
+del PREMIUM_HTML
+
+# Compressed once at startup (max level is affordable when it isn't per request),
+# ETags follow Flask-Compress' "<etag>:<encoding>" scheme
+_PREMIUM_HTML_VARIANTS = [
+    ("gzip", gzip.compress(_PREMIUM_HTML_BYTES, compresslevel=9), f"{_PREMIUM_HTML_ETAG}:gzip")
+]
+if brotli is not None:
+    _PREMIUM_HTML_VARIANTS.insert(
+        0, ("br", brotli.compress(_PREMIUM_HTML_BYTES, quality=11), f"{_PREMIUM_HTML_ETAG}:br")
+    )
+
 @app.route("/", methods=["GET"])
 def index():
     """Premium UI index page"""
-    return render_template_string(PREMIUM_HTML)
+    encoding, body, etag = None, _PREMIUM_HTML_BYTES, _PREMIUM_HTML_ETAG
+    # Highest client q-value wins; ties go to the earlier (smaller) variant
+    best = request.accept_encodings.best_match([name for name, _, _ in _PREMIUM_HTML_VARIANTS])
+    for variant in _PREMIUM_HTML_VARIANTS:
+        if variant[0] == best:
+            encoding, body, etag = variant
+            break
+
+    # Repeat visits revalidate with If-None-Match and get an empty 304
+    # (weak comparison, as If-None-Match requires, so proxy-weakened tags still match)
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = Response(body, content_type="text/html; charset=utf-8")
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+    response.set_etag(etag)
+    response.headers["Vary"] = "Accept-Encoding"
+    # The URL is stable but the page (and its asset hashes) change per deploy,
+    # so browsers must revalidate every time; the ETag makes that a cheap 304
+    response.headers["Cache-Control"] = "no-cache"
+    return response
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    # Production settings for better performance
-    app.run(
-        host="0.0.0.0",
-        port=port,
-        threaded=True,  # Enable threading for concurrent requests
-        debug=False  # Disable debug in production
-    )
+    if os.environ.get("FLASK_ENV") == "development":
+        # Werkzeug dev server, local debugging only
+        app.run(host="0.0.0.0", port=port, threaded=True, debug=False)
+    else:
+        # Production settings for better performance
+        from waitress import serve
+        serve(
+            app,
+            host="0.0.0.0",
+            port=port,
+            threads=int(os.environ.get("THREADS", 16)),
+            connection_limit=1000,
+            channel_timeout=30
+        )
@@ -0,0 +1,18 @@
+import multiprocessing
+import os
+
+# gunicorn -c gunicorn_conf.py app:app
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("THREADS", 32))
+keepalive = 30
+timeout = 30
+
+# Import the app once in the master, then give each worker its own pools
+preload_app = True
+
+
+def post_fork(server, worker):
+    import app
+    app.init_worker()
@@ -0,0 +1,152 @@
+// Loaded with defer, so the DOM is parsed by the time this runs
+
+// Server selection: one delegated listener on the container
+const serverSelect = document.querySelector('.server-select');
+let activeOption = serverSelect.querySelector('.server-option.active');
+let selectedServer = activeOption.dataset.value;
+
+serverSelect.addEventListener('click', e => {
+    const option = e.target.closest('.server-option');
+    if (!option || option === activeOption) return;
+    activeOption.classList.remove('active');
+    option.classList.add('active');
+    activeOption = option;
+    selectedServer = option.dataset.value;
+});
+
+// Form submission
+const form = document.getElementById('checkForm');
+const resultPanel = document.getElementById('resultPanel');
+const resultGrid = document.getElementById('resultGrid');
+const loading = document.getElementById('loading');
+const statusBadge = document.getElementById('statusBadge');
+const uidInput = document.getElementById('uid');
+
+// Same 8-16 digit rule as the input's pattern attribute
+const UID_RE = /^\d{8,16}$/;
+
+// Controller of the /check request currently in flight, if any
+let inflight = null;
+
+// Pre-parsed markup for result cards
+const cardTpl = document.getElementById('cardTpl').content;
+
+form.addEventListener('submit', async function(e) {
+    e.preventDefault();
+
+    const uid = uidInput.value.trim();
+
+    if (!UID_RE.test(uid)) {
+        alert('Please enter a valid 8-16 digit UID');
+        return;
+    }
+
+    // A new submit cancels the previous request instead of racing it
+    if (inflight) inflight.abort();
+    const controller = new AbortController();
+    inflight = controller;
+
+    // Show loading
+    loading.classList.add('show');
+    resultPanel.classList.remove('show');
+    resultGrid.replaceChildren();
+
+    try {
+        // Make API request
+        const response = await fetch(`/check?uid=${uid}&server=${selectedServer}`, {
+            signal: controller.signal,
+            cache: 'no-store',
+            credentials: 'omit'
+        });
+        const data = await response.json();
+
+        // Update UI with results
+        updateResults(data);
+
+        // Show results
+        resultPanel.classList.add('show');
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error:', error);
+        alert('Failed to check account. Please try again.');
+    } finally {
+        // Hide loading, unless a newer request has taken over
+        if (inflight === controller) {
+            inflight = null;
+            loading.classList.remove('show');
+        }
+    }
+});
+
+// Update results function
+function updateResults(data) {
+    // Add all data fields
+    const fields = [
+        { key: '🆔 UID', icon: 'fa-id-badge', label: 'UID' },
+        { key: '🏷️ Nickname', icon: 'fa-user', label: 'Nickname' },
+        { key: '🌍 Region', icon: 'fa-globe', label: 'Region' },
+        { key: '⭐ Level', icon: 'fa-star', label: 'Level' },
+        { key: '⚡ Experience', icon: 'fa-bolt', label: 'Experience' },
+        { key: '📊 Rank', icon: 'fa-chart-line', label: 'Rank Points' },
+        { key: '👥 Guild', icon: 'fa-users', label: 'Guild' },
+        { key: '🕒 Last Login', icon: 'fa-sign-in-alt', label: 'Last Login' },
+        { key: '🆕 Created At', icon: 'fa-calendar-plus', label: 'Created At' },
+        { key: '🔒 Account', icon: 'fa-shield-alt', label: 'Ban Status', className: () => data['📊 Banned?'] ? 'banned' : 'clean' },
+        { key: '⏳ Duration', icon: 'fa-clock', label: 'Ban Duration' }
+    ];
+
+    // Check for signature
+    if (data['✏️ BIO']) {
+        fields.push({ key: '✏️ BIO', icon: 'fa-quote-left', label: 'BIO' });
+    }
+
+    // Add powered by
+    fields.push({ key: '💎 Powered by', icon: 'fa-gem', label: 'Powered By' });
+    fields.push({ key: '📡 Channel', icon: 'fa-broadcast-tower', label: 'Community' });
+
+    // Clone a card per field and swap the grid contents in one go
+    const frag = document.createDocumentFragment();
+    for (const field of fields) {
+        if (!data[field.key]) continue;
+        const card = cardTpl.cloneNode(true);
+        card.querySelector('.result-card-icon').classList.add(field.icon);
+        card.querySelector('.result-card-label').textContent = field.label;
+        const value = card.querySelector('.result-card-value');
+        // textContent, so upstream strings (nickname, BIO) can't inject markup
+        value.textContent = data[field.key];
+        if (typeof field.className === 'function') value.classList.add(field.className());
+        frag.appendChild(card);
+    }
+    resultGrid.replaceChildren(frag);
+
+    // Update badge
+    const isBanned = data['📊 Banned?'];
+    if (isBanned) {
+        statusBadge.textContent = '🚫 BANNED';
+        statusBadge.className = 'result-status banned';
+    } else {
+        statusBadge.textContent = '✅ CLEAN';
+        statusBadge.className = 'result-status clean';
+    }
+
+    // Add animation
+    resultPanel.classList.remove('animate-in');
+    void resultPanel.offsetWidth; // Trigger reflow
+    resultPanel.classList.add('animate-in');
+}
+
+// Example UID input
+uidInput.addEventListener('click', function() {
+    if (this.value === '') {
+        this.value = '1234567890';
+        setTimeout(() => this.select(), 100);
+    }
+});
+
+// Animate elements on load
+const elements = document.querySelectorAll('.stat-card, .check-panel, .docs-panel');
+elements.forEach((el, index) => {
+    setTimeout(() => {
+        el.classList.add('animate-in');
+    }, index * 100);
+});